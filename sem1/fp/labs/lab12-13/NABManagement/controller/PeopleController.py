@@ -194,9 +194,9 @@ class PeopleController:
 
     def find_people_by_name(self, name):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their name.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their name.
         :param name: string - name to find people
-        :return: PersonRepository - people with the indicated substring as part of their name
+        :return: PersonRepositoryView - people with the indicated substring as part of their name
         :exception NABException: if one of the parameters is not valid
         '''
 
@@ -205,9 +205,9 @@ class PeopleController:
 
     def find_people_by_address(self, address):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their address.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their address.
         :param address: string - address to find people
-        :return: PersonRepository - people with the indicated substring as part of their address
+        :return: PersonRepositoryView - people with the indicated substring as part of their address
         :exception NABException: if one of the parameters is not valid
         '''
 
@@ -216,9 +216,9 @@ class PeopleController:
 
     def find_people_by_phone(self, phone):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their phone number.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their phone number.
         :param phone: string - phone number to find people
-        :return: PersonRepository - people with the indicated substring as part of their phone number
+        :return: PersonRepositoryView - people with the indicated substring as part of their phone number
         :exception NABException: if one of the parameters is not valid
         '''
 
@@ -7,6 +7,8 @@ class Person:
     Class used for handling people and information about a person.
     """
 
+    __slots__ = ("__id", "__name", "__phoneNumber", "__address", "__watchers")
+
     def __init__(self, id, name, phoneNumber, address):
         '''
         Constructor for the class Person.
@@ -37,6 +39,36 @@ class Person:
         self.__name = name
         self.__phoneNumber = phoneNumber
         self.__address = address
+        self.__watchers = []
+
+
+    def watch(self, callback):
+        '''
+        Registers a function to be called after the name, phone number or address of the current person is modified.
+        :param callback: function - called as callback(person, field, oldValue), where field is "name", "phone" or "address"
+        '''
+
+        self.__watchers.append(callback)
+
+
+    def unwatch(self, callback):
+        '''
+        Unregisters a function registered with watch().
+        :param callback: function - function to be unregistered
+        '''
+
+        self.__watchers.remove(callback)
+
+
+    def __notify(self, field, oldValue):
+        '''
+        Calls the registered functions after an attribute of the current person was modified.
+        :param field: string - name of the modified attribute
+        :param oldValue: string - value of the attribute before the modification
+        '''
+
+        for callback in self.__watchers:
+            callback(self, field, oldValue)
 
 
     @property
@@ -71,7 +103,9 @@ class Person:
         if type(newName) is not str:
             raise NABException("The given name is not a string.")
 
+        oldValue = self.__name
         self.__name = newName
+        self.__notify("name", oldValue)
 
 
     @property
@@ -96,7 +130,9 @@ class Person:
         if type(newPhoneNumber) is not str:
             raise NABException("The given phone number is not a string.")
 
+        oldValue = self.__phoneNumber
         self.__phoneNumber = newPhoneNumber
+        self.__notify("phone", oldValue)
 
 
     @property
@@ -121,7 +157,9 @@ class Person:
         if type(newAddress) is not str:
             raise NABException("The given address is not a string.")
 
+        oldValue = self.__address
         self.__address = newAddress
+        self.__notify("address", oldValue)
 
 
     def __eq__(self, other):
@@ -137,6 +175,19 @@ class Person:
         return (self.id == other.id) and (self.name == other.name) and (self.phone == other.phone) and (self.address) == (other.address)
 
 
+    def __deepcopy__(self, memo):
+        '''
+        Returns a copy of the current person with the same attributes, which is not watched by anyone.
+        :param memo: dict - objects already copied
+        :return: Person - copy of the current person
+        '''
+
+        copy = Person(self.__id, self.__name, self.__phoneNumber, self.__address)
+        memo[id(self)] = copy
+
+        return copy
+
+
     def __str__(self):
         '''
         Provides a short string representation of the information about a person in format "id - name - phone number - address".
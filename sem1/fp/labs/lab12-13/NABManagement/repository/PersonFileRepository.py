@@ -7,6 +7,8 @@ class PersonFileRepository(PersonRepository):
     Class used for handling in-file storage for a PersonRepository.
     """
 
+    __slots__ = ("__filename", "__separator")
+
     def __init__(self, filename):
         '''
         Constructor for the class PersonFileRepository.
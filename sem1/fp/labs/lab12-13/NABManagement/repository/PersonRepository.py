@@ -1,20 +1,118 @@
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from itertools import compress, repeat
+from operator import attrgetter
 from domain.NABException import NABException
 from domain.Person import Person
 from domain.PersonValidator import PersonValidator
-from utils.Useful import sort
+
+
+# Bound once so that the hot paths skip the class attribute lookup on every call.
+_valid_id = PersonValidator.valid_id
+
+# Key for ordering people by ID, evaluated in C instead of through a lambda.
+_ID_KEY = attrgetter("id")
+
+# Getters of the attributes searched by find_by_*, built once instead of on every query.
+_FIELD_KEYS = {field: attrgetter(field) for field in ("name", "address", "phone")}
+
+# Length of the substrings indexed for find_by_*; shorter queries are answered by a scan.
+_GRAM = 3
+
+# Number of pending people above which a flush sorts the whole list instead of inserting each of them.
+_BULK_FLUSH = 64
+
+
+def _position(ids, id):
+    '''
+    Binary searches a sorted list of IDs for the indicated ID.
+    :param ids: list of integer - IDs sorted increasingly
+    :param id: positive integer - ID of a person
+    :return: integer - position of the ID or -1 if it was not found
+    '''
+
+    pos = bisect_left(ids, id)
+
+    if pos < len(ids) and ids[pos] == id:
+        return pos
+    else:
+        return -1
+
+
+def _grams(text):
+    '''
+    Returns the substrings of length _GRAM of a text, after case folding it.
+    Case folding maps each character independently, so a substring of a text is still a substring after folding.
+    :param text: string - text to split
+    :return: set of string - distinct substrings of length _GRAM
+    '''
+
+    text = text.casefold()
+
+    return {text[i:i+_GRAM] for i in range(len(text) - _GRAM + 1)}
 
 
 class PersonRepository:
     """
     Class used for handling a list of people and maintaining the people sorted by ID.
+    The repository watches the people it contains, so the data it caches from their name, phone number and
+    address is discarded as soon as one of them is modified through its setters.
     """
 
+    __slots__ = ("__list", "__ids", "__pending", "__by_id", "__str_cache", "__columns", "__gram_indexes",
+                 "__queries")
+
+    # Number of find_by_* results kept, the least recently used being dropped first.
+    QUERY_CACHE_SIZE = 128
+
     def __init__(self):
         '''
         Constructor for the class PersonRepository.
         '''
 
+        # The list is kept sorted by ID, so readers never need to sort it.
+        # The IDs are mirrored in a parallel list of integers, so find() binary searches them in C
+        # without reading any attribute of a Person.
+        # add() only appends to the pending list, which is moved into the sorted one before the next read.
         self.__list = []
+        self.__ids = []
+        self.__pending = []
+        self.__by_id = {}
+        self.__str_cache = None
+        self.__columns = {}
+        self.__gram_indexes = {}
+        self.__queries = OrderedDict()
+
+
+    @classmethod
+    def from_iterable(cls, people):
+        '''
+        Builds a repository from an iterable of people, sorting them by ID only once.
+        :param people: iterable of Person - people to be added
+        :return: PersonRepository - repository containing the given people
+        :exception NABException: if one of the people is not valid or two people have the same ID
+        '''
+
+        people = list(people)
+
+        for person in people:
+            if type(person) is not Person:
+                raise NABException("The given person is not valid.")
+
+        people.sort(key=_ID_KEY)
+
+        repo = cls()
+        repo.__list = people
+        repo.__ids = list(map(_ID_KEY, people))
+        repo.__by_id = dict(zip(repo.__ids, people))
+
+        if len(repo.__by_id) != len(repo.__list):
+            raise NABException("There's already a person with that ID.")
+
+        for person in people:
+            person.watch(repo.__person_changed)
+
+        return repo
 
 
     def __len__(self):
@@ -23,9 +121,7 @@ class PersonRepository:
         :return: integer - length of the current list of people
         '''
 
-        self.__list[:] = sort(self.__list, key=lambda x: x.id)
-
-        return len(self.__list)
+        return len(self.__by_id)
 
 
     def __iter__(self):
@@ -34,17 +130,32 @@ class PersonRepository:
         :return: iter(list) - iterator object
         '''
 
-        self.__list[:] = sort(self.__list, key=lambda x: x.id)
+        self.__flush()
 
         return iter(self.__list)
 
 
+    def __contains__(self, person):
+        '''
+        Checks if a person is in the current list of people.
+        :param person: Person - person to check
+        :return: True - there's a person with the same attributes in the list; False - otherwise
+        '''
+
+        if type(person) is not Person:
+            return False
+
+        return self.__by_id.get(person.id) == person
+
+
     def all(self):
         '''
         Returns a list containing all the people.
         :return: list of Person
         '''
 
+        self.__flush()
+
         return self.__list
 
 
@@ -59,11 +170,17 @@ class PersonRepository:
         if type(person) is not Person:
             raise NABException("The given person is not valid.")
 
-        if self.find(person.id) != -1:
+        if person.id in self.__by_id:
             raise NABException("There's already a person with that ID.")
 
-        self.__list.append(person)
-        self.__list[:] = sort(self.__list, key=lambda x: x.id)
+        self.__pending.append(person)
+        self.__by_id[person.id] = person
+        person.watch(self.__person_changed)
+        self.__changed()
+
+        for field, index in self.__gram_indexes.items():
+            for gram in _grams(_FIELD_KEYS[field](person)):
+                index[gram].add(person.id)
 
 
     def find(self, id):
@@ -74,14 +191,12 @@ class PersonRepository:
         :exception NABException: if one of the parameters is not valid
         '''
 
-        if not PersonValidator.valid_id(id):
+        if not _valid_id(id):
             raise NABException("The given ID is not a positive integer.")
 
-        for i in range(len(self.__list)):
-            if self.__list[i].id == id:
-                return i
+        self.__flush()
 
-        return -1
+        return _position(self.__ids, id)
 
 
     def find_by_id(self, id):
@@ -92,77 +207,160 @@ class PersonRepository:
         :exception NABException: if one of the parameters is not valid or no person with the given ID was found
         '''
 
-        if not PersonValidator.valid_id(id):
+        if not _valid_id(id):
             raise NABException("The given ID is not a positive integer.")
 
-        pos = self.find(id)
-
-        if pos != -1:
-            return self.__list[pos]
-        else:
+        try:
+            return self.__by_id[id]
+        except KeyError:
             raise NABException("No person with the given ID was found.")
 
 
-    def find_by_name(self, name):
+    def find_by_name(self, name, *, ignoreCase=False):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their name.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their name.
         :param name: string - name to find people
-        :return: PersonRepository - people with the indicated substring as part of their name
+        :param ignoreCase: bool - whether letters are matched regardless of their case
+        :return: PersonRepositoryView - people with the indicated substring as part of their name
         :exception NABException: if one of the parameters is not valid
         '''
 
         if type(name) is not str:
             raise NABException("The given name is not a string.")
 
-        foundPeople = PersonRepository()
+        return self.__find("name", name, ignoreCase)
 
-        for person in self.__list:
-            if name in person.name:
-                foundPeople.add(person)
 
-        return foundPeople
-
-
-    def find_by_address(self, address):
+    def find_by_address(self, address, *, ignoreCase=False):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their address.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their address.
         :param address: string - address to find people
-        :return: PersonRepository - people with the indicated substring as part of their address
+        :param ignoreCase: bool - whether letters are matched regardless of their case
+        :return: PersonRepositoryView - people with the indicated substring as part of their address
         :exception NABException: if one of the parameters is not valid
         '''
 
         if type(address) is not str:
             raise NABException("The given address is not a string.")
 
-        foundPeople = PersonRepository()
-
-        for person in self.__list:
-            if address in person.address:
-                foundPeople.add(person)
-
-        return foundPeople
+        return self.__find("address", address, ignoreCase)
 
 
-    def find_by_phone(self, phone):
+    def find_by_phone(self, phone, *, ignoreCase=False):
         '''
-        Returns a PersonRepository which contains only people with the indicated substring as part of their phone number.
+        Returns a PersonRepositoryView which contains only people with the indicated substring as part of their phone number.
         :param phone: string - phone number to find people
-        :return: PersonRepository - people with the indicated substring as part of their phone number
+        :param ignoreCase: bool - whether letters are matched regardless of their case
+        :return: PersonRepositoryView - people with the indicated substring as part of their phone number
         :exception NABException: if one of the parameters is not valid
         '''
 
         if type(phone) is not str:
             raise NABException("The given phone number is not a string.")
 
-        foundPeople = PersonRepository()
+        return self.__find("phone", phone, ignoreCase)
+
+
+    def __find(self, field, text, ignoreCase):
+        '''
+        Returns a view of the people whose attribute contains the indicated text, reusing the result of a recent identical search.
+        :param field: string - name of the attribute of Person
+        :param text: string - text to search for
+        :param ignoreCase: bool - whether letters are matched regardless of their case
+        :return: PersonRepositoryView - people whose attribute contains the text
+        '''
+
+        # The views are immutable, so the same one can be handed to every caller of a query.
+        key = (field, text, ignoreCase)
+        foundPeople = self.__queries.get(key)
+
+        if foundPeople is not None:
+            self.__queries.move_to_end(key)
+            return foundPeople
 
-        for person in self.__list:
-            if phone in person.phone:
-                foundPeople.add(person)
+        foundPeople = PersonRepositoryView(self.__search(field, text, ignoreCase))
+        self.__queries[key] = foundPeople
+
+        if len(self.__queries) > self.QUERY_CACHE_SIZE:
+            self.__queries.popitem(last=False)
 
         return foundPeople
 
 
+    def __search(self, field, text, ignoreCase):
+        '''
+        Returns the people, in the order of the list, whose attribute contains the indicated text.
+        :param field: string - name of the attribute of Person
+        :param text: string - text to search for
+        :param ignoreCase: bool - whether letters are matched regardless of their case
+        :return: list of Person - people whose attribute contains the text
+        '''
+
+        self.__flush()
+
+        if ignoreCase:
+            text = text.lower()
+
+        if len(text) < _GRAM:
+            column = self.__column(field, ignoreCase)
+
+            return list(compress(self.__list, map(str.__contains__, column, repeat(text))))
+
+        # Only the people having every gram of the text can contain it, but they still have to be checked.
+        index = self.__gram_index(field)
+        postings = sorted([index.get(gram, set()) for gram in _grams(text)], key=len)
+        ids = sorted(postings[0].intersection(*postings[1:]))
+        candidates = list(map(self.__by_id.__getitem__, ids))
+        values = map(_FIELD_KEYS[field], candidates)
+
+        if ignoreCase:
+            values = map(str.lower, values)
+
+        return list(compress(candidates, map(str.__contains__, values, repeat(text))))
+
+
+    def __gram_index(self, field):
+        '''
+        Returns the index mapping each gram of an attribute to the IDs of the people having it, building it only once.
+        :param field: string - name of the attribute of Person
+        :return: dict of string to set of integer - IDs of the people for each gram
+        '''
+
+        index = self.__gram_indexes.get(field)
+
+        if index is None:
+            index = defaultdict(set)
+
+            for id, value in zip(self.__ids, self.__column(field)):
+                for gram in _grams(value):
+                    index[gram].add(id)
+
+            self.__gram_indexes[field] = index
+
+        return index
+
+
+    def __column(self, field, lower=False):
+        '''
+        Returns the values of an attribute for all the people, in the order of the list, building them only once.
+        :param field: string - name of the attribute of Person
+        :param lower: bool - whether the values are returned in lowercase
+        :return: list of string - values of the attribute
+        '''
+
+        column = self.__columns.get((field, lower))
+
+        if column is None:
+            if lower:
+                column = list(map(str.lower, self.__column(field)))
+            else:
+                column = list(map(_FIELD_KEYS[field], self.__list))
+
+            self.__columns[(field, lower)] = column
+
+        return column
+
+
     def remove(self, pos):
         '''
         Removes the person with the indicated position in the current list.
@@ -171,10 +369,32 @@ class PersonRepository:
         :exception NABException: if one of the parameters is not valid
         '''
 
+        self.__flush()
+
         if (type(pos) is not int) or (pos < 0 or pos >= len(self.__list)):
             raise NABException("The given position is not valid.")
 
-        return self.__list.pop(pos)
+        return self.__pop(pos)
+
+
+    def __pop(self, pos):
+        '''
+        Removes the person with the indicated position, which is known to be valid, from the list and the ID indexes.
+        :param pos: integer - valid position of a person in the current list
+        :return: Person - the person at the position pos
+        '''
+
+        person = self.__list.pop(pos)
+        del self.__ids[pos]
+        del self.__by_id[person.id]
+        person.unwatch(self.__person_changed)
+        self.__changed()
+
+        for field, index in self.__gram_indexes.items():
+            for gram in _grams(_FIELD_KEYS[field](person)):
+                index[gram].discard(person.id)
+
+        return person
 
 
     def remove_by_id(self, id):
@@ -185,27 +405,173 @@ class PersonRepository:
         :exception NABException: if one of the parameters is not valid or no person with the given ID was found
         '''
 
-        if not PersonValidator.valid_id(id):
+        if not _valid_id(id):
             raise NABException("The given ID is not a positive integer.")
 
-        pos = self.find(id)
+        self.__flush()
+        pos = _position(self.__ids, id)
 
-        if pos != - 1:
-            return self.remove(pos)
+        if pos != -1:
+            return self.__pop(pos)
         else:
             raise NABException("No person with the given ID was found.")
 
 
+    def __person_changed(self, person, field, oldValue):
+        '''
+        Discards the cached data and moves the person to its new grams after a person from the repository was modified.
+        :param person: Person - modified person
+        :param field: string - name of the modified attribute
+        :param oldValue: string - value of the attribute before the modification
+        '''
+
+        self.__changed()
+        index = self.__gram_indexes.get(field)
+
+        if index is not None:
+            for gram in _grams(oldValue):
+                index[gram].discard(person.id)
+
+            for gram in _grams(_FIELD_KEYS[field](person)):
+                index[gram].add(person.id)
+
+
+    def __flush(self):
+        '''
+        Moves the people added since the last read into the sorted list.
+        A few people are inserted at their positions; a large batch is appended and the whole list is sorted once.
+        '''
+
+        pending = self.__pending
+
+        if not pending:
+            return
+
+        if len(pending) <= _BULK_FLUSH:
+            for person in pending:
+                pos = bisect_left(self.__ids, person.id)
+                self.__ids.insert(pos, person.id)
+                self.__list.insert(pos, person)
+        else:
+            self.__list.extend(pending)
+            self.__list.sort(key=_ID_KEY)
+            self.__ids[:] = map(_ID_KEY, self.__list)
+
+        pending.clear()
+
+
+    def __changed(self):
+        '''
+        Discards the cached data which has to be rebuilt whenever people are added or removed.
+        '''
+
+        self.__str_cache = None
+        self.__columns.clear()
+        self.__queries.clear()
+
+
     def __str__(self):
         '''
         Returns a string representing the list of people in their short representation.
         :return: string - list of people or "None" if the list is empty
         '''
 
-        ret = ""
+        if self.__str_cache is None:
+            self.__flush()
+            self.__str_cache = "".join([str(person) for person in self.__list])
+
+        if self.__str_cache != "":
+            return self.__str_cache
+        else:
+            return "None\n"
+
+
+class PersonRepositoryView:
+    """
+    Class used for handling a read-only selection of people sorted by ID, as found by a PersonRepository search.
+    A modifiable copy can be obtained with PersonRepository.from_iterable(view).
+    """
+
+    __slots__ = ("__people", "__ids")
+
+    def __init__(self, people):
+        '''
+        Constructor for the class PersonRepositoryView.
+        :param people: iterable of Person - people sorted by ID, with distinct IDs
+        '''
+
+        # Kept as a tuple, so that neither the callers nor a cache sharing the view can change it.
+        self.__people = tuple(people)
+        self.__ids = None
+
+
+    def __len__(self):
+        '''
+        Returns the number of people in the view.
+        :return: integer - number of people in the view
+        '''
+
+        return len(self.__people)
+
+
+    def __iter__(self):
+        '''
+        Returns an iterator object for the view.
+        :return: iter(tuple) - iterator object
+        '''
+
+        return iter(self.__people)
+
+
+    def all(self):
+        '''
+        Returns a tuple containing all the people in the view.
+        :return: tuple of Person
+        '''
+
+        return self.__people
+
+
+    def find(self, id):
+        '''
+        Returns the index of the person whose id is equal to the given one.
+        :param id: positive integer - ID of a person
+        :return: integer - position of the person or -1 if no person with the given ID was found
+        :exception NABException: if one of the parameters is not valid
+        '''
+
+        if not _valid_id(id):
+            raise NABException("The given ID is not a positive integer.")
+
+        if self.__ids is None:
+            self.__ids = list(map(_ID_KEY, self.__people))
+
+        return _position(self.__ids, id)
+
+
+    def find_by_id(self, id):
+        '''
+        Returns the person from the view with the indicated ID.
+        :param id: positive integer - ID of a person
+        :return: Person - the person with the ID id
+        :exception NABException: if one of the parameters is not valid or no person with the given ID was found
+        '''
+
+        pos = self.find(id)
+
+        if pos != -1:
+            return self.__people[pos]
+        else:
+            raise NABException("No person with the given ID was found.")
+
+
+    def __str__(self):
+        '''
+        Returns a string representing the people in the view in their short representation.
+        :return: string - list of people or "None" if the view is empty
+        '''
 
-        for person in self.__list:
-            ret += str(person)
+        ret = "".join([str(person) for person in self.__people])
 
         if ret != "":
             return ret
@@ -85,3 +85,25 @@ class PeopleControllerTestCase(unittest.TestCase):
         self.assertEqual(L.number_of_people(), 0)
 
 
+    def test_update_person(self):
+        R = PersonRepository()
+        L = PeopleController(R)
+        p = Person(1, "John", "1", "A")
+
+        L.add_person(p)
+        self.assertEqual(str(R), "1 - John - 1 - A\n")
+
+        L.update_person_name(p, "Jack")
+        self.assertEqual(str(R), "1 - Jack - 1 - A\n")
+
+        L.update_person_address(p, "B")
+        self.assertEqual(str(R), "1 - Jack - 1 - B\n")
+
+        L.undo()
+        self.assertEqual(str(R), "1 - Jack - 1 - A\n")
+
+        L.redo()
+        self.assertEqual(str(R), "1 - Jack - 1 - B\n")
+
+        L.remove_person_by_id(1)
+        self.assertEqual(str(R), "None\n")
\ No newline at end of file
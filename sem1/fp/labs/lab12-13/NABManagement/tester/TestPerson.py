@@ -1,4 +1,5 @@
 import unittest
+from copy import deepcopy
 from domain.Person import Person
 from domain.NABException import NABException
 
@@ -32,6 +33,24 @@ class PersonTestCase(unittest.TestCase):
         self.assertEqual(x.address, "1")
 
 
+    def test_watch(self):
+        x = self.x
+        changes = []
+        callback = lambda person, field, oldValue: changes.append((person, field, oldValue))
+
+        x.watch(callback)
+        x.name = "Enoch"
+        x.address = "1"
+        self.assertEqual(changes, [(x, "name", "James"), (x, "address", "9")])
+
+        deepcopy(x).phone = "0750111000"
+        self.assertEqual(len(changes), 2)
+
+        x.unwatch(callback)
+        x.phone = "0750111000"
+        self.assertEqual(len(changes), 2)
+
+
     def test_eq(self):
         self.assertEqual(self.x, self.x)
         self.assertEqual(self.x, self.y)
@@ -34,6 +34,74 @@ class PersonRepositoryTestCase(unittest.TestCase):
         self.assertEqual(L.find_by_id(5), self.p[5])
         self.assertRaises(NABException, L.find_by_id, self.p[1])
 
+        L = PersonRepository()
+
+        L.add(self.p[7])
+        L.add(self.p[1])
+        L.add(self.p[5])
+        L.add(self.p[2])
+        self.assertEqual([p.id for p in L], [1, 2, 5, 7])
+        self.assertRaises(NABException, L.add, Person(5, "Anne", "2", "D"))
+        self.assertEqual(len(L), 4)
+
+
+    def test_add_between_reads(self):
+        L = PersonRepository()
+
+        L.add(self.p[7])
+        L.add(self.p[1])
+        self.assertEqual(L.find(7), 1)
+        self.assertEqual(str(L), "1 - John - 1 - A\n7 - Mike - 4 - C\n")
+
+        L.add(self.p[5])
+        self.assertEqual(len(L), 3)
+        self.assertEqual(L.find_by_id(5), self.p[5])
+        self.assertEqual([p.id for p in L.all()], [1, 5, 7])
+
+        L.add(self.p[2])
+        self.assertEqual(L.remove(1), self.p[2])
+        self.assertRaises(NABException, L.add, self.p[5])
+
+        L.add(self.p[2])
+        self.assertEqual(L.remove_by_id(5), self.p[5])
+        self.assertEqual(str(L), "1 - John - 1 - A\n2 - Mary - 1 - B\n7 - Mike - 4 - C\n")
+
+
+    def test_add_and_read_alternately(self):
+        L = PersonRepository()
+        ids = [(i * 7919) % 5003 + 1 for i in range(5000)]
+
+        for id in ids:
+            L.add(Person(id, "John", "1", "A"))
+            self.assertNotEqual(L.find(id), -1)
+
+        self.assertEqual([p.id for p in L], sorted(ids))
+        self.assertEqual(L.find(sorted(ids)[2500]), 2500)
+
+        for id in ids[:200]:
+            L.add(Person(id + 6000, "Mary", "1", "B"))
+
+        self.assertEqual(L.find(ids[0] + 6000), 5000 + sorted(ids[:200]).index(ids[0]))
+        self.assertEqual(L.all(), sorted(L.all(), key=lambda p: p.id))
+        self.assertEqual(L.remove_by_id(ids[1]).id, ids[1])
+
+
+    def test_from_iterable(self):
+        L = PersonRepository.from_iterable([self.p[7], self.p[1], self.p[5], self.p[2]])
+
+        self.assertEqual(len(L), 4)
+        self.assertEqual([p.id for p in L], [1, 2, 5, 7])
+        self.assertEqual(L.find(5), 2)
+        self.assertEqual(L.find_by_id(7), self.p[7])
+        self.assertEqual(str(L), str(self.L))
+
+        L.add(Person(3, "Anne", "2", "D"))
+        self.assertEqual(L.find(3), 2)
+
+        self.assertEqual(len(PersonRepository.from_iterable([])), 0)
+        self.assertRaises(NABException, PersonRepository.from_iterable, [self.p[1], self.p[2], self.p[1]])
+        self.assertRaises(NABException, PersonRepository.from_iterable, [self.p[1], 2])
+
 
     def test_find(self):
         L = self.L
@@ -45,6 +113,27 @@ class PersonRepositoryTestCase(unittest.TestCase):
         self.assertEqual(L.find(7), 3)
         self.assertRaises(NABException, L.find, -1)
 
+        L = PersonRepository()
+
+        for id in range(100, 0, -3):
+            L.add(Person(id, "John", "1", "A"))
+
+        self.assertEqual(L.find(1), 0)
+        self.assertEqual(L.find(100), len(L)-1)
+        self.assertEqual(L.find(52), 17)
+        self.assertEqual(L.find(50), -1)
+        self.assertEqual(L.find(101), -1)
+
+
+    def test_contains(self):
+        L = self.L
+
+        self.assertTrue(self.p[1] in L)
+        self.assertTrue(Person(5, "Mike", "3", "B") in L)
+        self.assertFalse(Person(5, "Mike", "3", "C") in L)
+        self.assertFalse(Person(3, "John", "1", "A") in L)
+        self.assertFalse(1 in L)
+
 
     def test_find_by_id(self):
         L = self.L
@@ -67,9 +156,126 @@ class PersonRepositoryTestCase(unittest.TestCase):
         self.assertEqual(len(P), 1)
         self.assertNotEqual(P.find(2), -1)
 
+        P = L.find_by_name("Mi")
+        self.assertEqual(len(P), 2)
+        self.assertNotEqual(P.find(5), -1)
+        self.assertNotEqual(P.find(7), -1)
+
+        P = L.find_by_name("Mikes")
+        self.assertEqual(len(P), 0)
+
         P = L.find_by_name("Sophie")
         self.assertEqual(len(P), 0)
 
+        P = L.find_by_name("mIKE", ignoreCase=True)
+        self.assertEqual(len(P), 2)
+        self.assertNotEqual(P.find(5), -1)
+        self.assertNotEqual(P.find(7), -1)
+
+        P = L.find_by_name("mike")
+        self.assertEqual(len(P), 0)
+
+
+    def test_find_by_name_indexed(self):
+        L = self.L
+
+        P = L.find_by_name("ike")
+        self.assertEqual(len(P), 2)
+        self.assertNotEqual(P.find(5), -1)
+        self.assertNotEqual(P.find(7), -1)
+
+        L.add(Person(3, "Mikaela", "2", "D"))
+        L.add(Person(4, "Spike", "2", "D"))
+        P = L.find_by_name("ike")
+        self.assertEqual([p.id for p in P], [4, 5, 7])
+
+        P = L.find_by_name("MIK", ignoreCase=True)
+        self.assertEqual([p.id for p in P], [3, 5, 7])
+
+        P = L.find_by_name("Mik")
+        self.assertEqual([p.id for p in P], [3, 5, 7])
+
+        P = L.find_by_name("ikes")
+        self.assertEqual(len(P), 0)
+
+        L.remove_by_id(5)
+        P = L.find_by_name("ike")
+        self.assertEqual([p.id for p in P], [4, 7])
+
+        L.find_by_id(4).name = "Spiky"
+        P = L.find_by_name("ike")
+        self.assertEqual([p.id for p in P], [7])
+
+        L.find_by_id(7).name = "Zed Ike"
+        self.assertEqual([p.id for p in L.find_by_name("Zed")], [7])
+        self.assertEqual(len(L.find_by_name("Mike")), 0)
+
+        L.remove_by_id(7)
+        self.assertEqual(len(L.find_by_name("Zed")), 0)
+        self.assertEqual(len(L.find_by_name("Ike", ignoreCase=True)), 0)
+
+
+    def test_person_modified(self):
+        L = self.L
+        p = Person(3, "Anne", "2", "D")
+
+        L.add(p)
+        self.assertEqual(str(L.find_by_id(3)), str(L).split("\n")[2] + "\n")
+
+        L.find_by_id(3).name = "Zed"
+        self.assertEqual(str(L).split("\n")[2], "3 - Zed - 2 - D")
+        self.assertEqual([q.id for q in L.find_by_name("Zed")], [3])
+        self.assertEqual([q.id for q in L.find_by_name("e", ignoreCase=True)], [3, 5, 7])
+
+        L.remove_by_id(3)
+        p.name = "Mike"
+        self.assertEqual(len(L), 4)
+        self.assertEqual(len(L.find_by_name("Mike")), 2)
+
+
+    def test_find_by_name_cached(self):
+        L = self.L
+
+        P = L.find_by_name("Mike")
+        self.assertIs(L.find_by_name("Mike"), P)
+        self.assertIsNot(L.find_by_name("Mike", ignoreCase=True), P)
+
+        L.add(Person(3, "Mike", "2", "D"))
+        P = L.find_by_name("Mike")
+        self.assertEqual([p.id for p in P], [3, 5, 7])
+
+        L.remove_by_id(7)
+        P = L.find_by_name("Mike")
+        self.assertEqual([p.id for p in P], [3, 5])
+
+        L.find_by_id(3).name = "Anne"
+        self.assertIsNot(L.find_by_name("Mike"), P)
+        self.assertEqual([p.id for p in L.find_by_name("Mike")], [5])
+
+
+    def test_find_by_name_cache_shared(self):
+        L = self.L
+
+        P = L.find_by_name("Mi")
+        self.assertRaises(AttributeError, getattr, P.all(), "pop")
+        self.assertEqual([p.id for p in L.find_by_name("Mi")], [5, 7])
+        self.assertEqual(L.find_by_name("Mi").find_by_id(7), self.p[7])
+
+
+    def test_find_by_name_cache_bound(self):
+        L = self.L
+        size = PersonRepository.QUERY_CACHE_SIZE
+
+        found = [L.find_by_name("q" + str(i)) for i in range(size)]
+        self.assertIs(L.find_by_name("q0"), found[0])
+
+        L.find_by_name("q" + str(size))
+        self.assertIs(L.find_by_name("q0"), found[0])
+        self.assertIsNot(L.find_by_name("q1"), found[1])
+        self.assertIs(L.find_by_name("q3"), found[3])
+        self.assertIsNot(L.find_by_name("q2"), found[2])
+        self.assertIs(L.find_by_name("q" + str(size-1)), found[size-1])
+
 
     def test_find_by_phone(self):
         L = self.L
@@ -102,6 +308,11 @@ class PersonRepositoryTestCase(unittest.TestCase):
         P = L.find_by_address("D")
         self.assertEqual(len(P), 0)
 
+        P = L.find_by_address("b", ignoreCase=True)
+        self.assertEqual(len(P), 2)
+        self.assertNotEqual(P.find(2), -1)
+        self.assertNotEqual(P.find(5), -1)
+
 
     def test_remove(self):
         L = self.L
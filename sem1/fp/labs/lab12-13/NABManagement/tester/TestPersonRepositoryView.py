@@ -0,0 +1,68 @@
+import unittest
+from domain.Person import Person
+from domain.NABException import NABException
+from repository.PersonRepository import PersonRepository, PersonRepositoryView
+
+
+class PersonRepositoryViewTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.p = {}
+        self.p[2] = Person(2, "Mary", "1", "B")
+        self.p[5] = Person(5, "Mike", "3", "B")
+        self.p[7] = Person(7, "Mike", "4", "C")
+        self.V = PersonRepositoryView([self.p[2], self.p[5], self.p[7]])
+
+
+    def test_len(self):
+        self.assertEqual(len(self.V), 3)
+        self.assertEqual(len(PersonRepositoryView([])), 0)
+
+
+    def test_iter(self):
+        self.assertEqual([p.id for p in self.V], [2, 5, 7])
+
+
+    def test_all(self):
+        people = [self.p[2], self.p[5], self.p[7]]
+        V = PersonRepositoryView(people)
+
+        self.assertEqual(V.all(), (self.p[2], self.p[5], self.p[7]))
+        self.assertRaises(AttributeError, getattr, V.all(), "pop")
+
+        self.assertEqual(V.find(5), 1)
+        people.insert(0, Person(9, "Anne", "2", "D"))
+        self.assertEqual(len(V), 3)
+        self.assertEqual(V.find_by_id(5), self.p[5])
+        self.assertRaises(NABException, V.find_by_id, 9)
+
+
+    def test_find(self):
+        V = self.V
+
+        self.assertEqual(V.find(2), 0)
+        self.assertEqual(V.find(7), 2)
+        self.assertEqual(V.find(1), -1)
+        self.assertEqual(V.find(6), -1)
+        self.assertRaises(NABException, V.find, -1)
+
+
+    def test_find_by_id(self):
+        V = self.V
+
+        self.assertEqual(V.find_by_id(5), self.p[5])
+        self.assertRaises(NABException, V.find_by_id, 3)
+        self.assertRaises(NABException, V.find_by_id, -1)
+
+
+    def test_str(self):
+        self.assertEqual(str(self.V), "2 - Mary - 1 - B\n5 - Mike - 3 - B\n7 - Mike - 4 - C\n")
+        self.assertEqual(str(PersonRepositoryView([])), "None\n")
+
+
+    def test_from_iterable(self):
+        L = PersonRepository.from_iterable(self.V)
+
+        L.add(Person(1, "John", "1", "A"))
+        self.assertEqual(len(L), 4)
+        self.assertEqual(len(self.V), 3)
\ No newline at end of file